@@ -1,6 +1,5 @@
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
-from starlette.applications import Starlette
 from starlette.routing import Mount
 
 mcp = FastMCP("My App")